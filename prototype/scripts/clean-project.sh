@@ -5,3 +5,4 @@
 find . -name "*.py[co]" -delete
 find . -name '__pycache__' -delete
 find . -name '.ipynb_checkpoints' -exec rm -fr '{}' \;
+find . -name '.track.*.pickle' -delete
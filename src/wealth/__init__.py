@@ -2,4 +2,4 @@
 from wealth.config import config
 from wealth.importers import init
 from wealth.ui.display import display, display_side_by_side
-from wealth.ui.format import Money, money_fmt, percent_fmt
+from wealth.ui.format import Money, money_fmt, money_series, percent_fmt
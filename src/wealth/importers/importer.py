@@ -6,7 +6,6 @@ import re
 from pathlib import Path
 from typing import Iterable
 
-import numpy as np
 import pandas as pd
 
 import wealth.config
@@ -17,22 +16,19 @@ from wealth.importers.common import transfer_columns
 from wealth.util.transaction_type import TransactionType
 
 
-def __create_transaction_type(row: pd.Series) -> TransactionType:
-    """Create a TransactionType object from a dataframe row."""
-    if isinstance(row["transaction_type"], TransactionType):
-        return row["transaction_type"]
-
-    accounts = wealth.config.get("accounts", {})
-    ibans = [accounts[acc].get("iban", 0) for acc in accounts.keys()]
-    if row["iban"] in ibans:
-        return TransactionType.from_amount(row["amount"], is_internal=True)
-    return TransactionType.from_amount(row["amount"], is_internal=False)
-
-
 def __add_transaction_type_column(df: pd.DataFrame) -> pd.DataFrame:
     """Populate a column named transaction_type with values of type
-    TransactionType to the given data frame and return the same DataFrame."""
-    df["transaction_type"] = df.apply(__create_transaction_type, axis="columns")
+    TransactionType to the given data frame and return the same DataFrame.
+    Keep transaction types that the importers already set."""
+    accounts = wealth.config.get("accounts", {})
+    ibans = [accounts[acc].get("iban", 0) for acc in accounts.keys()]
+    types = TransactionType.from_amounts(
+        df["amount"].to_numpy(), is_internal=df["iban"].isin(ibans).to_numpy()
+    )
+    given = df["transaction_type"].to_numpy()
+    has_type = df["transaction_type"].notna().to_numpy()
+    types[has_type] = given[has_type]
+    df["transaction_type"] = types
     return df
 
 
@@ -49,6 +45,21 @@ def _append_all_data_column_with_transaction_type(
     return df
 
 
+def __fill_missing_texts(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace missing values in the given DataFrame's text columns with empty
+    strings and return the same DataFrame. Leave other columns' dtypes intact."""
+    text_columns = [
+        "account",
+        "description",
+        "account_type",
+        "correspondent",
+        "iban",
+        "all_data",
+    ]
+    df[text_columns] = df[text_columns].fillna("")
+    return df
+
+
 def __yield_files_with_suffix(directory: Path, suffix: str) -> Iterable[Path]:
     """Yield all files with the given suffix in the given folder."""
     suffix_lower = suffix.lower()
@@ -125,7 +136,8 @@ def init() -> pd.DataFrame:
         __read_account_csvs()
         .pipe(__add_transaction_type_column)
         .pipe(_append_all_data_column_with_transaction_type)
-        .replace(np.nan, "", regex=True)[
+        .pipe(__fill_missing_texts)
+        .astype({"account": "category"})[
             [
                 "date",
                 "account",
@@ -7,11 +7,6 @@ from wealth.importers.common import add_all_data_column, to_lower, transfer_colu
 from wealth.util import TransactionType
 
 
-def __create_internal_transaction_type(row) -> TransactionType:
-    """Create a suitable transaction type according to the given row."""
-    return TransactionType.from_row(row, is_internal=True)
-
-
 def __handle_transactions_between_n26_spaces(df: pd.DataFrame) -> pd.DataFrame:
     """Filter all rows that depict transactions between account-internal
     n26-spaces, rename their account name according to their sub-account and
@@ -29,8 +24,8 @@ def __handle_transactions_between_n26_spaces(df: pd.DataFrame) -> pd.DataFrame:
     internal = df[mask].copy()
     df = df[~mask]
 
-    internal["transaction_type"] = internal.apply(
-        __create_internal_transaction_type, axis="columns"
+    internal["transaction_type"] = TransactionType.from_amounts(
+        internal["amount"].to_numpy(), is_internal=True
     )
 
     internal.loc[internal["correspondent"] != "main account", "correspondent"] = (
@@ -48,6 +43,7 @@ def __handle_transactions_between_n26_spaces(df: pd.DataFrame) -> pd.DataFrame:
 
     return df
 
+
 def read_csv(path: str, account_name: str) -> pd.DataFrame:
     """Import csv data from N26 giro/mastercard accounts and consider n26's
     sub-accounts."""
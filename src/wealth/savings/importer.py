@@ -4,6 +4,8 @@ import pathlib
 import pandas as pd
 import pandas.api.types as ptypes
 
+from wealth.util.dates import is_monotonic_dates
+
 from .type import TransactionType
 
 
@@ -14,7 +16,7 @@ def __assert_df_integrity(df: pd.DataFrame) -> None:
             'Column "date" must contain only date values. '
             f'Column "date" looks like:\n{df["date"]}'
         )
-    if not df["date"].is_monotonic:
+    if not is_monotonic_dates(df["date"]):
         raise AssertionError(
             'Column "date" must be monotonic increasing. '
             f'Column "date" looks like:\n{df["date"]}'
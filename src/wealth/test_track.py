@@ -0,0 +1,27 @@
+"""Test the module `track`."""
+from pathlib import Path
+
+import pytest
+
+from .track import track
+
+
+def test_track_with_blank_type(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that `track()` handles rows without a type and leaves them out of the
+    numbers per type."""
+    (tmp_path / "csv").mkdir()
+    (tmp_path / "notebooks").mkdir()
+    (tmp_path / "csv" / "track.csv").write_text(
+        "date;what;price;type;bucket\n"
+        "2021-01-01;budget;-400;budget;shopping\n"
+        "2021-01-01;budget;-200;budget;wealth\n"
+        "2021-01-02;bread;3;food;shopping\n"
+        "2021-01-03;gift;10;;wealth\n"
+    )
+    monkeypatch.chdir(tmp_path / "notebooks")
+
+    df, context = track()
+
+    assert len(df) == 4
+    assert set(context.numbers_per_type.index) == {"budget", "food"}
+    assert context.numbers_per_type["# entries"].sum() == 3
@@ -3,6 +3,10 @@ Track expenses and cluster them according to type and subtype."""
 import calendar
 from math import ceil
 import datetime as dt
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -15,13 +19,14 @@ from pandas.io.formats.style import Styler
 
 from wealth.importers.common import to_lower
 from wealth.ui.display import display
-from wealth.ui.format import float_fmt, money_fmt
+from wealth.ui.format import date_fmt, float_fmt, money_fmt
 from wealth.ui.styles import (
     bar_color,
+    black_color,
     conditional_negative_style,
-    conditional_positive_bg_style,
     css_str,
     css_str_wrap,
+    green_color,
     monthly_border,
     red_fg,
     shopping_bg,
@@ -30,53 +35,101 @@ from wealth.ui.styles import (
     wealth_bg,
     wealth_border,
 )
+from wealth.util.dates import is_monotonic_dates
 
 
 def __style_track(
-    cols,
+    df: pd.DataFrame,
     special_indices: pd.Index,
     types2colors: dict[str, str],
-) -> list[dict[str, str]]:
+) -> pd.DataFrame:
     """CSS-style the track DataFrame's cells with colors and font weight
     depending on the bucket, type, the balance and whether a row is the last
     entry in a month."""
-    styles: list[dict[str, str]] = [{}] * 9
+    styles = np.full(df.shape, "", dtype=object)
 
-    styles[1] = shopping_bg if cols["bucket"] == "shopping" else wealth_bg
-
-    type_color = types2colors[cols["type"]]
-    styles[2] = {"background": type_color, "color": "#000000ee"}.copy()
-    styles[3] = {"background": type_color, "color": "#000000ee"}.copy()
-
-    styles[4] = conditional_positive_bg_style(cols["price"])
-    if cols["monthly shopping balance"] < 0:
-        styles[5] = red_fg.copy()
-    if cols["continuous shopping balance"] < 0:
-        styles[6] = red_fg.copy()
-    if cols["monthly wealth balance"] < 0:
-        styles[7] = red_fg.copy()
-    if cols["continuous wealth balance"] < 0:
-        styles[8] = red_fg.copy()
+    styles[:, 1] = np.where(
+        df["bucket"].values == "shopping", css_str(shopping_bg), css_str(wealth_bg)
+    )
 
-    if cols.name in special_indices:
-        topline = {"border-top": "2px solid #cccccc"}
-        for i in range(9):
-            styles[i].update(topline.copy())
+    types2css = {
+        type_: css_str({"background": color, "color": "#000000ee"})
+        for type_, color in types2colors.items()
+    }
+    styles[:, 2] = df["type"].map(types2css).fillna("").values
+    styles[:, 3] = styles[:, 2]
 
-    return [css_str(s) for s in styles]
+    styles[df["price"].values > 0, 4] = css_str(
+        {"background": green_color, "color": black_color}
+    )
+    red_css = css_str(red_fg)
+    for i, col in enumerate(
+        (
+            "monthly shopping balance",
+            "continuous shopping balance",
+            "monthly wealth balance",
+            "continuous wealth balance",
+        ),
+        start=5,
+    ):
+        styles[df[col].values < 0, i] = red_css
+
+    is_special = df.index.isin(special_indices)
+    styles[is_special] += css_str({"border-top": "2px solid #cccccc"})
+
+    return pd.DataFrame(styles, index=df.index, columns=df.columns)
+
+
+# Version of the DataFrame layout cached by `__import_track_df()`. Increase it
+# whenever the cached columns or dtypes change.
+_track_cache_version = 2
+
+
+def __read_track_cache(cache_path: Path) -> Optional[pd.DataFrame]:
+    """Read the cached track DataFrame if there is a readable one."""
+    if not cache_path.exists():
+        return None
+    try:
+        return pd.read_pickle(cache_path)
+    except Exception:  # pylint:disable=broad-except
+        logging.getLogger().warning("Could not read %s.", cache_path)
+        return None
+
+
+def __write_track_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """Replace all cached track DataFrames with the given one."""
+    for stale_cache_path in cache_path.parent.glob(".track.*.pickle"):
+        try:
+            stale_cache_path.unlink()
+        except OSError:
+            pass
+    try:
+        df.to_pickle(cache_path)
+    except OSError:
+        logging.getLogger().warning("Could not write %s.", cache_path)
 
 
 def __import_track_df() -> pd.DataFrame:
-    """Import the file `track.csv`."""
+    """Import the file `track.csv`.
+    Cache the imported DataFrame next to the csv file and reuse the cache as
+    long as the csv file does not change."""
+    csv_path = Path("../csv/track.csv")
+    cache_path = csv_path.with_name(
+        f".track.v{_track_cache_version}.pandas-{pd.__version__}"
+        f".{csv_path.stat().st_mtime_ns}.pickle"
+    )
+    df = __read_track_cache(cache_path)
+    if df is not None:
+        return df
+
     df = pd.read_csv(
-        "../csv/track.csv",
-        engine="python",
+        csv_path,
         parse_dates=["date"],
         sep=";",
     ).pipe(to_lower)
     df["price"] = df["price"] * -1
 
-    return df[
+    df = df[
         [
             "date",
             "bucket",
@@ -85,6 +138,10 @@ def __import_track_df() -> pd.DataFrame:
             "price",
         ]
     ]
+    df["bucket"] = df["bucket"].astype("category")
+    df["type"] = df["type"].astype("category")
+    __write_track_cache(df, cache_path)
+    return df
 
 
 def __assert_df_integrity(df: pd.DataFrame) -> None:
@@ -94,7 +151,7 @@ def __assert_df_integrity(df: pd.DataFrame) -> None:
             'Column "date" must contain only date values. '
             f'Column "date" looks like:\n{df["date"]}'
         )
-    if not df["date"].is_monotonic:
+    if not is_monotonic_dates(df["date"]):
         raise AssertionError(
             'Column "date" must be monotonic increasing. '
             f'Column "date" looks like:\n{df["date"]}'
@@ -104,10 +161,11 @@ def __assert_df_integrity(df: pd.DataFrame) -> None:
             'Column "price" must contain only numeric values. '
             f'Column "price" looks like:\n{df["price"]}'
         )
-    if not set(df["bucket"].tolist()) == set(["shopping", "wealth"]):
+    buckets = set(pd.unique(df["bucket"].values))
+    if not buckets == set(["shopping", "wealth"]):
         raise AssertionError(
             'Column "bucket" must contain only values "shopping" or "wealth". '
-            f'Column "bucket" looks like:\n{set(df["bucket"].tolist())}'
+            f'Column "bucket" looks like:\n{buckets}'
         )
 
 
@@ -144,14 +202,16 @@ def __style(df: pd.DataFrame, first_indices_per_month: pd.Index) -> Styler:
         hex_ = mpl.colors.rgb2hex(cmap(i))
         types2colors[type_] = hex_
 
+    fmt = money_fmt()
     return (
         df.style.format(
             formatter={
-                "price": money_fmt(),
-                "monthly shopping balance": money_fmt(),
-                "continuous shopping balance": money_fmt(),
-                "monthly wealth balance": money_fmt(),
-                "continuous wealth balance": money_fmt(),
+                "date": date_fmt,
+                "price": fmt,
+                "monthly shopping balance": fmt,
+                "continuous shopping balance": fmt,
+                "monthly wealth balance": fmt,
+                "continuous wealth balance": fmt,
             },
             na_rep="",
         )
@@ -171,79 +231,83 @@ def __style(df: pd.DataFrame, first_indices_per_month: pd.Index) -> Styler:
             __style_track,
             special_indices=first_indices_per_month,
             types2colors=types2colors,
-            axis="columns",
+            axis=None,
         )
     )
 
 
-def track() -> pd.DataFrame:
-    """Import the file `track.csv` and return it as a DataFrame."""
+@dataclass
+class TrackContext:
+    """The figures that `track()` derives from the track DataFrame and that
+    `render_track()` displays."""
+
+    first_indices_per_month: pd.Index
+    current_month_df: pd.DataFrame
+    remaining_for_current_month: pd.DataFrame
+    average_month: pd.DataFrame
+    numbers_by_bucket: pd.DataFrame
+    numbers_per_type: pd.DataFrame
+    monthly_end_balances: pd.DataFrame
+    monthly_costs: pd.DataFrame
+    yearly_costs: pd.DataFrame
+
+
+def track() -> tuple[pd.DataFrame, TrackContext]:
+    """Import the file `track.csv`, compute the balances and summaries and
+    return the DataFrame together with the summaries."""
     df = __import_track_df()
     __assert_df_integrity(df)
 
-    n_days = (df["date"].iloc[-1] - df["date"].iloc[0]).days
+    is_shop = df["bucket"].values == "shopping"
+    is_wealth = ~is_shop
+    is_budget = df["type"].values == "budget"
+    not_budget = ~is_budget
 
-    year_and_month = df["date"].astype(str).apply(lambda x: x[:7])
+    dates = df["date"].values
+    n_days = int((dates[-1] - dates[0]) / np.timedelta64(1, "D"))
 
-    df["monthly shopping balance"] = (
-        df[df["bucket"] == "shopping"].groupby(year_and_month)["price"].cumsum()
-    )
-    df["continuous shopping balance"] = df[df["bucket"] == "shopping"]["price"].cumsum()
-    df["monthly wealth balance"] = (
-        df[df["bucket"] == "wealth"].groupby(year_and_month)["price"].cumsum()
-    )
-    df["continuous wealth balance"] = df[df["bucket"] == "wealth"]["price"].cumsum()
-
-    monthly_end_balances = (
-        df[["date", "monthly shopping balance", "monthly wealth balance"]]
-        .ffill()
-        .groupby(year_and_month)
-        .tail(1)
-        .set_index("date", drop=True)
-        .rename(
-            columns={
-                "monthly shopping balance": "shopping",
-                "monthly wealth balance": "wealth",
-            }
-        )
-    )
-    monthly_end_balances.index = monthly_end_balances.index.to_period("M")
-    monthly_end_balances_style = (
-        monthly_end_balances.style.format(formatter=money_fmt())
-        .bar(color=bar_color, align="left", vmin=0)
-        .applymap(css_str_wrap(conditional_negative_style))
-    )
+    year_and_month = df["date"].values.astype("datetime64[M]")
 
-    monthly_costs = df[df["type"] != "budget"][["date", "bucket"]]
-    monthly_costs["shopping"] = -df[df["bucket"] == "shopping"]["price"]
-    monthly_costs["wealth"] = -df[df["bucket"] == "wealth"]["price"]
-    monthly_costs.fillna(0, inplace=True)
-    monthly_costs = monthly_costs.groupby(year_and_month).sum()
+    bucket_and_month = year_and_month.view("i8") * 2 + is_shop
+    monthly = df.groupby(bucket_and_month, sort=False)["price"].cumsum()
+    continuous = df.groupby(is_shop, sort=False)["price"].cumsum()
+    df["monthly shopping balance"] = monthly.where(is_shop)
+    df["continuous shopping balance"] = continuous.where(is_shop)
+    df["monthly wealth balance"] = monthly.where(is_wealth)
+    df["continuous wealth balance"] = continuous.where(is_wealth)
 
-    monthly_costs_style = (
-        monthly_costs.style.format(formatter=money_fmt())
-        .bar(color=bar_color, align="left", vmin=0)
-        .applymap(css_str_wrap(conditional_negative_style))
+    monthly_end_balances = pd.concat(
+        {
+            "shopping": df.loc[is_shop, "monthly shopping balance"]
+            .groupby(year_and_month[is_shop])
+            .last(),
+            "wealth": df.loc[is_wealth, "monthly wealth balance"]
+            .groupby(year_and_month[is_wealth])
+            .last(),
+        },
+        axis="columns",
+    ).ffill()
+    monthly_end_balances.index = monthly_end_balances.index.to_period("M").rename(
+        "date"
     )
 
-    year = monthly_costs.index.to_series().astype(str).apply(lambda x: x[:4])
-    yearly_costs = monthly_costs.groupby(year).sum()
-    yearly_costs_style = (
-        yearly_costs.style.format(formatter=money_fmt())
-        .bar(color=bar_color, align="left", vmin=0)
-        .applymap(css_str_wrap(conditional_negative_style))
-    )
+    monthly_costs = pd.DataFrame(index=df.index[not_budget])
+    monthly_costs["shopping"] = -df.loc[is_shop, "price"]
+    monthly_costs["wealth"] = -df.loc[is_wealth, "price"]
+    monthly_costs.fillna(0, inplace=True)
+    monthly_costs = monthly_costs.groupby(year_and_month[not_budget]).sum()
+    monthly_costs.index = monthly_costs.index.to_period("M").rename("date")
 
-    first_indices_per_month = df.groupby(year_and_month).head(1).index
+    yearly_costs = monthly_costs.groupby(monthly_costs.index.year).sum()
 
-    df["date"] = df["date"].apply(lambda x: x.date())
-    all_months_style = __style(df, first_indices_per_month)
+    is_month_start = np.empty(len(df), dtype=bool)
+    is_month_start[:1] = True
+    is_month_start[1:] = year_and_month[1:] != year_and_month[:-1]
+    first_indices_per_month = df.index[is_month_start]
 
     max_date = df["date"].max()
     current_month_df = df[df["date"] > max_date - relativedelta(days=max_date.day)]
 
-    current_month_style = __style(current_month_df, first_indices_per_month)
-
     shop_col = df["monthly shopping balance"].dropna()
     wealth_col = df["monthly wealth balance"].dropna()
     remaining_for_current_month = pd.DataFrame(
@@ -266,7 +330,7 @@ def track() -> pd.DataFrame:
 
     remaining_for_current_month["remaining per week"] = np.where(
         remaining_days > 7 and remaining_for_current_month["remaining"] > 0,
-        remaining_for_current_month["remaining"] / ceil(remaining_days/7),
+        remaining_for_current_month["remaining"] / ceil(remaining_days / 7),
         remaining_for_current_month["remaining"],
     )
 
@@ -274,36 +338,25 @@ def track() -> pd.DataFrame:
         remaining_for_current_month["remaining"] / remaining_days
     )
 
-    remaining_for_current_month_style = (
-        remaining_for_current_month.style.format(formatter=money_fmt())
-        .set_properties(subset="remaining", **total_border)
-        .applymap(css_str_wrap(conditional_negative_style))
-    )
-
-    current_month_style = __style(current_month_df, first_indices_per_month)
-
     average_month = __make_average_month(df)
-    average_month_style = (
-        average_month.style.format(formatter=money_fmt())
-        .set_properties(subset="monthly shopping balance", **shopping_border)
-        .set_properties(subset="monthly wealth balance", **wealth_border)
-        .bar(
-            subset=[
-                "monthly shopping balance",
-                "monthly wealth balance",
-            ],
-            color=bar_color,
-            align="zero",
-        )
-    )
 
-    numbers_by_bucket = (
-        df.groupby(df[df["type"] == "budget"]["bucket"])[["bucket", "price"]]
-        .sum()
-        .rename(columns={"price": "total budget"})
-    )
-    numbers_by_bucket["total cost"] = (
-        df.groupby(df[df["type"] != "budget"]["bucket"])["price"].sum().mul(-1)
+    prices = df["price"].values
+    bucket_codes = df["bucket"].cat.codes.values
+    buckets = df["bucket"].cat.categories.rename("bucket")
+    numbers_by_bucket = pd.DataFrame(
+        {
+            "total budget": np.bincount(
+                bucket_codes[is_budget],
+                weights=prices[is_budget],
+                minlength=len(buckets),
+            ),
+            "total cost": np.bincount(
+                bucket_codes[not_budget],
+                weights=-prices[not_budget],
+                minlength=len(buckets),
+            ),
+        },
+        index=buckets,
     )
     numbers_by_bucket["total balance"] = (
         numbers_by_bucket["total budget"] - numbers_by_bucket["total cost"]
@@ -318,15 +371,18 @@ def track() -> pd.DataFrame:
         numbers_by_bucket["avg monthly budget"] - numbers_by_bucket["avg monthly cost"]
     )
 
-    numbers_by_bucket_style = (
-        numbers_by_bucket.style.format(formatter=money_fmt())
-        .set_properties(subset="total budget", **total_border)
-        .set_properties(subset="avg monthly budget", **monthly_border)
-        .applymap(css_str_wrap(conditional_negative_style))
-    )
-
-    numbers_per_type = (
-        df.groupby(df["type"]).price.agg(["sum", "count"]).mul({"sum": -1, "count": 1})
+    type_codes = df["type"].cat.codes.values
+    has_type = type_codes >= 0
+    type_codes = type_codes[has_type]
+    types = df["type"].cat.categories.rename("type")
+    numbers_per_type = pd.DataFrame(
+        {
+            "sum": np.bincount(
+                type_codes, weights=-prices[has_type], minlength=len(types)
+            ),
+            "count": np.bincount(type_codes, minlength=len(types)),
+        },
+        index=types,
     )
     numbers_per_type["avg monthly cost"] = numbers_per_type["sum"] / n_days * 30
     numbers_per_type["avg monthly entries"] = numbers_per_type["count"] / n_days * 30
@@ -349,12 +405,62 @@ def track() -> pd.DataFrame:
         ]
     ]
 
-    numbers_per_type_style = numbers_per_type.style.format(
+    context = TrackContext(
+        first_indices_per_month=first_indices_per_month,
+        current_month_df=current_month_df,
+        remaining_for_current_month=remaining_for_current_month,
+        average_month=average_month,
+        numbers_by_bucket=numbers_by_bucket,
+        numbers_per_type=numbers_per_type,
+        monthly_end_balances=monthly_end_balances,
+        monthly_costs=monthly_costs,
+        yearly_costs=yearly_costs,
+    )
+    return df, context
+
+
+def render_track(df: pd.DataFrame, context: TrackContext) -> None:
+    """Style and display the given track DataFrame and the summaries that
+    `track()` computed for it."""
+    fmt = money_fmt()
+
+    current_month_style = __style(
+        context.current_month_df, context.first_indices_per_month
+    )
+
+    remaining_for_current_month_style = (
+        context.remaining_for_current_month.style.format(formatter=fmt)
+        .set_properties(subset="remaining", **total_border)
+        .applymap(css_str_wrap(conditional_negative_style))
+    )
+
+    average_month_style = (
+        context.average_month.style.format(formatter=fmt)
+        .set_properties(subset="monthly shopping balance", **shopping_border)
+        .set_properties(subset="monthly wealth balance", **wealth_border)
+        .bar(
+            subset=[
+                "monthly shopping balance",
+                "monthly wealth balance",
+            ],
+            color=bar_color,
+            align="zero",
+        )
+    )
+
+    numbers_by_bucket_style = (
+        context.numbers_by_bucket.style.format(formatter=fmt)
+        .set_properties(subset="total budget", **total_border)
+        .set_properties(subset="avg monthly budget", **monthly_border)
+        .applymap(css_str_wrap(conditional_negative_style))
+    )
+
+    numbers_per_type_style = context.numbers_per_type.style.format(
         formatter={
-            "total cost": money_fmt(),
-            "avg monthly cost": money_fmt(),
+            "total cost": fmt,
+            "avg monthly cost": fmt,
             "avg monthly entries": float_fmt,
-            "avg entry cost": money_fmt(),
+            "avg entry cost": fmt,
         }
     ).bar(
         align="left",
@@ -363,6 +469,26 @@ def track() -> pd.DataFrame:
         vmin=0,
     )
 
+    monthly_end_balances_style = (
+        context.monthly_end_balances.style.format(formatter=fmt)
+        .bar(color=bar_color, align="left", vmin=0)
+        .applymap(css_str_wrap(conditional_negative_style))
+    )
+
+    monthly_costs_style = (
+        context.monthly_costs.style.format(formatter=fmt)
+        .bar(color=bar_color, align="left", vmin=0)
+        .applymap(css_str_wrap(conditional_negative_style))
+    )
+
+    yearly_costs_style = (
+        context.yearly_costs.style.format(formatter=fmt)
+        .bar(color=bar_color, align="left", vmin=0)
+        .applymap(css_str_wrap(conditional_negative_style))
+    )
+
+    all_months_style = __style(df, context.first_indices_per_month)
+
     out = Output()
     with out:
         display("<br>Current month:")
@@ -385,5 +511,3 @@ def track() -> pd.DataFrame:
         display(all_months_style)
 
     display(out)
-
-    return df
@@ -1,41 +1,52 @@
 """User Interface related code for transactions."""
+import functools
+
 import pandas as pd
+from IPython.display import display_html
 from ipywidgets import Checkbox, Output
 
-from wealth.ui.display import display
+from wealth.ui.display import display, styler_html
 from wealth.ui.format import date_fmt, money_fmt
-from wealth.ui.styles import transaction_type_column_styles
+from wealth.ui.styles import transaction_type_frame_styles
 from wealth.ui.widgets import align_checkboxes, create_account_checkboxes
 
 
 class UI:
     """User interface for the transactions feature."""
 
-    def __update_output(self, df: pd.DataFrame) -> None:
-        """Render the DataFrame."""
+    def __render(self, accounts: tuple[str, ...]) -> str:
+        """Render the transactions of the given accounts as HTML."""
+        selected = self.__accounts.isin(accounts)
+        df = self.__reversed_df[selected[self.__account_codes]]
         style = df.style.format(
             formatter={
                 "amount": money_fmt(),
                 "date": date_fmt,
-            }
-        ).apply(transaction_type_column_styles, axis="columns")
+            },
+            na_rep="",
+        ).apply(transaction_type_frame_styles, axis=None)
+        return styler_html(style)
 
+    def __update_output(self, html: str) -> None:
+        """Display the rendered transactions."""
         self.__out.clear_output()
         with self.__out:
-            display(style)
+            display_html(html, raw=True)
 
     def __on_widgets_change(self, *_) -> None:
         """On observer change, recalculate the the results, update the output
         and return the results."""
-        accounts = [
+        accounts = tuple(
             c.description for c in self.__checkboxes if c.value and c.value != "All"
-        ]
-        df = self.__df[self.__df["account"].isin(accounts)].iloc[::-1]
-        self.__update_output(df)
+        )
+        self.__update_output(self.__cached_render(accounts))
 
     def __init__(self, df: pd.DataFrame):
         """Run the UI callback system with the given transaction-DataFrame."""
-        self.__df = df
+        self.__reversed_df = df.iloc[::-1]
+        self.__accounts = self.__reversed_df["account"].cat.categories
+        self.__account_codes = self.__reversed_df["account"].cat.codes.values
+        self.__cached_render = functools.lru_cache(maxsize=32)(self.__render)
 
         self.__out = Output()
         self.__checkboxes: list[Checkbox] = []
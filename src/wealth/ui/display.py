@@ -7,34 +7,46 @@ from IPython.display import display as ipython_display
 from IPython.display import display_html
 from pandas.io.formats.style import Styler
 
+pd.set_option("display.max_rows", None)
+pd.set_option("display.max_colwidth", None)
+pd.set_option("display.precision", 2)
+
+_inline_attributes = "style='display: inline; padding: 10px;'"
+_inline_block_css = "display: inline-block; padding: 10px;"
+
+
+def styler_html(style: Styler) -> str:
+    """Render the given Styler to an HTML table.
+    Use `Styler.to_html()` and fall back to `Styler.render()` on pandas < 1.3."""
+    to_html = getattr(style, "to_html", None)
+    return to_html() if to_html is not None else style.render()
+
 
 def display(o: Any) -> None:
     """Display an object.
     Print strings as Markdown.
-    Print dataframes and styles with `max_rows` set to None aka infinity,
-    `max_colwitdth` set to inifinity and numeric precision set to 2."""
-    options = {
-        "display.max_rows": None,
-        "display.max_colwidth": None,
-        "display.precision": 2,
-    }
-    with pd.option_context(*[i for option in list(options.items()) for i in option]):
-        if isinstance(o, pd.DataFrame):
-            ipython_display(o.style)
-        elif isinstance(o, str):
-            ipython_display(Markdown(o))
-        else:
-            ipython_display(o)
+    Print dataframes and styles with the display options set on import, i.e.
+    `max_rows` set to None aka infinity, `max_colwitdth` set to inifinity and
+    numeric precision set to 2."""
+    if isinstance(o, str):
+        ipython_display(Markdown(o))
+    elif isinstance(o, pd.DataFrame):
+        ipython_display(o.style)
+    else:
+        ipython_display(o)
 
 
 def display_side_by_side(objs: Iterable[Union[pd.DataFrame, Styler]]) -> None:
     """Display the given dataframes/styles and the given titles side by side in
     an inline manner."""
-    html_str = ""
+    parts: list[str] = []
     for o in objs:
-        style = o if isinstance(o, Styler) else o.style
-        style.set_table_attributes("style='display: inline; padding: 10px;'")
-        # pylint:disable=protected-access
-        html_str += style._repr_html_()
+        if not isinstance(o, Styler):
+            # Plain DataFrames need no cell styles, skip the Styler templates.
+            html = o.to_html(border=0)
+            parts.append(f"<div style='{_inline_block_css}'>{html}</div>")
+            continue
+        o.set_table_attributes(_inline_attributes)
+        parts.append(styler_html(o))
 
-    display_html(html_str, raw=True)
+    display_html("".join(parts), raw=True)
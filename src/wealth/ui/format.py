@@ -1,6 +1,9 @@
 """Contains string-formatting functions and utilities."""
+import functools
 from typing import Callable, Optional
 
+import pandas as pd
+
 from wealth.config import config
 
 weekday_date = "%a, %Y-%m-%d"
@@ -11,18 +14,39 @@ percent_fmt = "{:,.2f}%".format
 year_fmt = "{:%Y}".format
 
 
+@functools.lru_cache(maxsize=None)
 def money_fmt(currency: Optional[str] = None) -> Callable:
     """Return a currency string format function with given currency symbol.
-    If no currency symbol is given, use the symbol from the config."""
+    If no currency symbol is given, use the symbol from the config.
+    The format function is cached per currency."""
     currency = config["currency"] if currency is None else currency
     return ("{:,.2f}" + f"{currency}").format
 
 
+# Money format function for the currency from the config.
+_default_money_fmt = money_fmt()
+
+
+def refresh_currency() -> None:
+    """Rebuild the cached money format functions after the currency in the
+    config changed."""
+    global _default_money_fmt  # pylint:disable=global-statement
+    money_fmt.cache_clear()
+    _default_money_fmt = money_fmt()
+
+
 def Money(value: float, currency: Optional[str] = None) -> str:
     """Return the given value as a string with given amount and currency symbol.
     If no currency symbol is given, use the symbol from the config."""
-    currency = config["currency"] if currency is None else currency
-    return money_fmt(currency)(value)
+    fmt = _default_money_fmt if currency is None else money_fmt(currency)
+    return fmt(value)
+
+
+def money_series(values: pd.Series, currency: Optional[str] = None) -> pd.Series:
+    """Return the given Series of values as strings with amount and currency
+    symbol. If no currency symbol is given, use the symbol from the config.
+    Leave missing values as they are."""
+    return values.map(money_fmt(currency), na_action="ignore")
 
 
 def ratio_fmt(value: float) -> str:
@@ -6,6 +6,8 @@ box = Layout(margin="20px 0px 20px 0px")
 checkbox = Layout(width="100px")
 checkbox_wide = Layout(width="250px")
 
+label_slim = Layout(width="80px")
+
 dropdown = Layout(width="250px")
 dropdown_slim = Layout(width="200px")
 
@@ -1,23 +1,40 @@
 """Contains common matplotlib functionality."""
+import functools
+
 import matplotlib as mpl
-import matplotlib.pyplot as plt
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_int_comma(x: int) -> str:
+    """Format the given integer with thousands separators."""
+    return format(x, ",")
+
+
+def _int_comma(x: float, _) -> str:
+    """Format the given tick value as an integer with thousands separators."""
+    return _fmt_int_comma(int(x))
+
+
+# Formatters only format tick values and can be shared between axes. Locators
+# read the view limits of the axis they are set on, so they stay per axis.
+_DATE_FMT = mpl.dates.DateFormatter("%b %d '%y")
+_YEAR_FMT = mpl.dates.DateFormatter("%Y")
+_INT_FMT = mpl.ticker.FuncFormatter(_int_comma)
 
 
 def setup_plot_and_axes(
     fig: mpl.figure.Figure, title: str, xlabel="Time", ylabel="Euros"
 ) -> None:
     """Set up the plot, axes and title for the given figure for a plot."""
-    plt.title(title)
-    plt.grid(color="k", linestyle="-", linewidth=0.1)
-    ax = fig.axes[0]
+    ax = fig.gca()
+    ax.set_title(title)
+    ax.grid(color="k", linestyle="-", linewidth=0.1)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
-    ax.xaxis.set_major_formatter(mpl.dates.DateFormatter("%b %d '%y"))
+    ax.xaxis.set_major_formatter(_DATE_FMT)
     ax.xaxis.set_major_locator(mpl.dates.MonthLocator())
     ax.xaxis.set_minor_locator(mpl.dates.WeekdayLocator(byweekday=0))
-    ax.yaxis.set_major_formatter(
-        mpl.ticker.FuncFormatter(lambda x, _: format(int(x), ","))
-    )
+    ax.yaxis.set_major_formatter(_INT_FMT)
     fig.autofmt_xdate()
 
 
@@ -25,14 +42,12 @@ def setup_yearly_plot_and_axes(
     fig: mpl.figure.Figure, title: str, xlabel="Time", ylabel="Euros"
 ) -> None:
     """Set up the plot, axes and title for the given figure for a plot."""
-    plt.title(title)
-    plt.grid(color="k", linestyle="-", linewidth=0.1)
-    ax = fig.axes[0]
+    ax = fig.gca()
+    ax.set_title(title)
+    ax.grid(color="k", linestyle="-", linewidth=0.1)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
-    ax.xaxis.set_major_formatter(mpl.dates.DateFormatter("%Y"))
+    ax.xaxis.set_major_formatter(_YEAR_FMT)
     ax.xaxis.set_major_locator(mpl.dates.YearLocator())
-    ax.yaxis.set_major_formatter(
-        mpl.ticker.FuncFormatter(lambda x, _: format(int(x), ","))
-    )
-    plt.xticks(rotation=45)
+    ax.yaxis.set_major_formatter(_INT_FMT)
+    ax.tick_params(axis="x", labelrotation=45)
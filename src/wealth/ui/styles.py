@@ -1,8 +1,10 @@
 """Common Dataframe styler definitions."""
-import functools
 from typing import Any, Callable
 
-from wealth.util.transaction_type import TransactionType
+import numpy as np
+import pandas as pd
+
+from wealth.util.transaction_type import TransactionType, internal_types
 
 bar_color = "#d65fdf30"
 shopping_color = "#ffff00dd"
@@ -33,6 +35,9 @@ red_fg = {"color": red_color}
 shopping_bg = {"background": shopping_color, "color": "#000000ee"}
 wealth_bg = {"background": wealth_color, "color": "#000000ee"}
 
+green_bg_css = f"background: {green_color}"
+yellow_bg_css = f"background: {yellow_color}"
+
 
 def css_str(css_dict: dict[str, str]) -> str:
     """Convert the given css-dict to a css style string."""
@@ -43,17 +48,12 @@ def css_str_wrap(fun: Callable[[Any], dict[str, str]]) -> Callable[[Any], str]:
     """Return the given function wrapped around css_str()
     so that it returns a string."""
 
-    def __css_str(val: Any, fun: Callable[[Any], dict[str, str]]) -> str:
+    def __css_str(val: Any) -> str:
         """Call the given function with the given value and convert its result
         to a css style string."""
         return css_str(fun(val))
 
-    return functools.partial(__css_str, fun=fun)
-
-
-def conditional_positive_bg_style(value) -> dict[str, str]:
-    """Return a red font color if the given value is smaller than 0."""
-    return {"background": green_color, "color": black_color} if value > 0 else {}
+    return __css_str
 
 
 def conditional_negative_style(value) -> dict[str, str]:
@@ -61,14 +61,20 @@ def conditional_negative_style(value) -> dict[str, str]:
     return {"color": red_color} if value < 0 else {}
 
 
-def transaction_type_column_styles(cols) -> list[str]:
-    """Return a green back color if the given value is an income and return a
-    yellow back color if the given value is an internal transactions."""
-    type_ = cols["transaction_type"]
-    if type_ == TransactionType.IN:
-        color = f"background: {green_color}"
-    elif type_ in [TransactionType.INTERNAL_IN, TransactionType.INTERNAL_OUT]:
-        color = f"background: {yellow_color}"
-    else:
-        color = ""
-    return [color] * len(cols)
+def transaction_type_frame_styles(df: pd.DataFrame) -> pd.DataFrame:
+    """Return css styles for all cells of the given DataFrame that give rows of
+    incomes a green back color and rows of internal transactions a yellow back
+    color. Use with `Styler.apply(..., axis=None)`."""
+    types = df["transaction_type"]
+    is_income = (types == TransactionType.IN).values
+    is_internal = types.isin(internal_types).values
+    row_styles = np.where(
+        is_income,
+        green_bg_css,
+        np.where(is_internal, yellow_bg_css, ""),
+    )
+    return pd.DataFrame(
+        np.repeat(row_styles[:, np.newaxis], df.shape[1], axis=1),
+        index=df.index,
+        columns=df.columns,
+    )
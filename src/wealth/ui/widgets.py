@@ -1,5 +1,9 @@
 """Common ipywidget arrangements."""
-from typing import Callable
+import asyncio
+import functools
+import logging
+import operator
+from typing import Callable, Optional
 
 import pandas as pd
 from ipywidgets import (
@@ -8,21 +12,59 @@ from ipywidgets import (
     FloatSlider,
     HBox,
     Label,
-    Layout,
     dlink,
     jslink,
 )
 
-from .layouts import box, checkbox, text_slim
+from .layouts import box, checkbox, label_slim, text_slim
 
-frequency_options = [
+frequency_options: tuple[tuple[str, str], ...] = (
     ("Day", "D"),
     ("Week", "W-MON"),
     ("SemiMonth", "SMS"),
     ("Month", "MS"),
     ("Quarter", "QS"),
     ("Year", "AS"),
-]
+)
+
+_accounts_label = Label("Accounts: ", layout=label_slim)
+
+
+def __call_logging_errors(func: Callable, *args, **kwargs) -> None:
+    """Call the given function and log its exceptions, which would otherwise end
+    up in the event loop's exception handler."""
+    try:
+        func(*args, **kwargs)
+    except Exception:  # pylint:disable=broad-except
+        logging.getLogger().exception("Error in %s", func.__name__)
+
+
+def debounce(wait: float) -> Callable:
+    """Decorator that postpones calls to the decorated function until `wait`
+    seconds have passed since the last call; only the last call is executed.
+    Without a running event loop, call the function right away."""
+
+    def decorator(func: Callable) -> Callable:
+        timer: Optional[asyncio.TimerHandle] = None
+
+        @functools.wraps(func)
+        def debounced(*args, **kwargs):
+            nonlocal timer
+            if timer is not None:
+                timer.cancel()
+                timer = None
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                func(*args, **kwargs)
+                return
+            timer = loop.call_later(
+                wait, functools.partial(__call_logging_errors, func, *args, **kwargs)
+            )
+
+        return debounced
+
+    return decorator
 
 
 def create_account_checkboxes(
@@ -33,21 +75,22 @@ def create_account_checkboxes(
 ) -> list[Checkbox]:
     """Create checkboxes for every account in the given dataframe, assign the
     given callback to these checkboxes and add them to the given list."""
+    debounced_callback = debounce(0.05)(callback)
     chk_all = Checkbox(value=value, description="All", indent=False, layout=checkbox)
     out_checkboxes.append(chk_all)
-    for account in df["account"].unique():
+    for account in pd.unique(df["account"].to_numpy()):
         chk = Checkbox(value=value, description=account, indent=False, layout=checkbox)
-        chk.observe(callback, "value")
+        chk.observe(debounced_callback, "value")
         dlink((chk_all, "value"), (chk, "value"))
         out_checkboxes.append(chk)
-        out_checkboxes.sort(key=lambda chk: chk.description)
+    out_checkboxes.sort(key=operator.attrgetter("description"))
     return out_checkboxes
 
 
 def align_checkboxes(checkboxes: list[Checkbox]) -> HBox:
     """Return a HBox containing all given checkboxes."""
     return HBox(
-        [Label("Accounts: ", layout=Layout(width="80px")), *checkboxes],
+        [_accounts_label, *checkboxes],
         layout=box,
     )
 
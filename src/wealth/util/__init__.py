@@ -1,3 +1,4 @@
 """Package for `Wealth` utilities."""
+from .dates import is_monotonic_dates
 from .deepupdate import deepupdate
 from .transaction_type import TransactionType
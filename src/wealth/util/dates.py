@@ -0,0 +1,10 @@
+"""Contains helper functions for date columns."""
+import pandas as pd
+
+
+def is_monotonic_dates(dates: pd.Series) -> bool:
+    """Determine if the given datetime Series is monotonic increasing and has no
+    missing values, like `is_monotonic_increasing` but faster.
+    NaT views as the smallest int64, so reject it explicitly."""
+    values = dates.values.view("i8")
+    return not dates.isna().any() and bool((values[1:] >= values[:-1]).all())
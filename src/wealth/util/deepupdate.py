@@ -1,16 +1,20 @@
 """Contains a function to update a dict with another dict while preserving
 possible nested dicts."""
-from copy import deepcopy
 
 
 def deepupdate(d: dict, u: dict) -> dict:
     """Update a given dict `d` with another dict `u`. Recursively retain and
-    update nested dicts in `u`."""
-    r = deepcopy(d)
-    r.update(u)
+    update nested dicts in `u`. Only nested dicts are copied, other values are
+    shared with `d` and `u`."""
+    r = {}
     for k, v in d.items():
         if isinstance(v, dict):
-            w = u.get(k, {})
-            r[k] = deepupdate(v, w) if isinstance(w, dict) else d[k]
+            w = u.get(k)
+            r[k] = deepupdate(v, w if isinstance(w, dict) else {})
+        else:
+            r[k] = v
+    for k, v in u.items():
+        if not isinstance(d.get(k), dict):
+            r[k] = v
 
     return r
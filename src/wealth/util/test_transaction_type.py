@@ -0,0 +1,68 @@
+"""Test the module `transaction_type`."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import wealth
+import wealth.importers.importer
+
+from .transaction_type import TransactionType
+
+IN = TransactionType.IN
+OUT = TransactionType.OUT
+INTERNAL_IN = TransactionType.INTERNAL_IN
+INTERNAL_OUT = TransactionType.INTERNAL_OUT
+
+
+def test_from_amounts_with_mixed_amounts() -> None:
+    """Test that `from_amounts()` classifies positive amounts as incomes and zero
+    or negative amounts as expenses, like `from_amount()`."""
+    amounts = np.array([12.5, 0.0, -3.0, -0.0])
+    result = TransactionType.from_amounts(amounts)
+    assert list(result) == [IN, OUT, OUT, OUT]
+    assert list(result) == [TransactionType.from_amount(a) for a in amounts]
+
+
+def test_from_amounts_with_nan_amounts() -> None:
+    """Test that `from_amounts()` classifies NaN amounts as incomes, like
+    `from_amount()`."""
+    amounts = np.array([np.nan, -1.0])
+    result = TransactionType.from_amounts(amounts)
+    assert list(result) == [IN, OUT]
+    assert list(result) == [TransactionType.from_amount(a) for a in amounts]
+
+
+@pytest.mark.parametrize(
+    "is_internal, expected",
+    [
+        (False, [IN, OUT]),
+        (True, [INTERNAL_IN, INTERNAL_OUT]),
+        (np.array([True, False]), [INTERNAL_IN, OUT]),
+        (np.array([False, True]), [IN, INTERNAL_OUT]),
+    ],
+)
+def test_from_amounts_with_scalar_and_array_is_internal(is_internal, expected) -> None:
+    """Test that `from_amounts()` accepts `is_internal` both as a scalar for all
+    amounts and as an array with one value per amount."""
+    result = TransactionType.from_amounts(np.array([1.0, -1.0]), is_internal)
+    assert list(result) == expected
+
+
+def test_add_transaction_type_column_keeps_preset_types(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the importer only fills in transaction types that are missing
+    and keeps the ones an account importer already set."""
+    monkeypatch.setitem(wealth.config, "accounts", {"giro": {"iban": "DE01"}})
+    add_transaction_type_column = getattr(
+        wealth.importers.importer, "__add_transaction_type_column"
+    )
+    df = pd.DataFrame(
+        {
+            "amount": [5.0, -5.0, -5.0, 5.0],
+            "iban": ["XX", "XX", "DE01", "XX"],
+            "transaction_type": [None, None, None, INTERNAL_OUT],
+        }
+    )
+    result = add_transaction_type_column(df)
+    assert list(result["transaction_type"]) == [IN, OUT, INTERNAL_OUT, INTERNAL_OUT]
@@ -1,6 +1,9 @@
 """Contains an enumeration to classify transactions as expenses, incomes or
 internal transactions and according helper functions."""
 from enum import Flag, auto
+from typing import Union
+
+import numpy as np
 
 
 class TransactionType(Flag):
@@ -15,15 +18,30 @@ class TransactionType(Flag):
     @staticmethod
     def create(is_expense: bool, is_internal: bool) -> "TransactionType":
         """Create a TransactionType object that fits the given traits."""
-        if is_expense:
-            return TransactionType.INTERNAL_OUT if is_internal else TransactionType.OUT
-        return TransactionType.INTERNAL_IN if is_internal else TransactionType.IN
+        return _LUT[bool(is_expense), bool(is_internal)]
 
     @staticmethod
     def from_amount(amount: float, is_internal: bool = False) -> "TransactionType":
         """Create a TransactionType object given an amount."""
         return TransactionType.create(amount <= 0, is_internal)
 
+    @staticmethod
+    def from_amounts(
+        amounts: np.ndarray, is_internal: Union[bool, np.ndarray] = False
+    ) -> np.ndarray:
+        """Create an object array of TransactionType objects given an array of
+        amounts and whether each of them is an internal transaction."""
+        is_expense = np.asarray(amounts) <= 0
+        is_internal = np.broadcast_to(
+            np.asarray(is_internal, dtype=bool), is_expense.shape
+        )
+        out = np.empty(is_expense.shape, dtype=object)
+        out[is_expense & is_internal] = TransactionType.INTERNAL_OUT
+        out[is_expense & ~is_internal] = TransactionType.OUT
+        out[~is_expense & is_internal] = TransactionType.INTERNAL_IN
+        out[~is_expense & ~is_internal] = TransactionType.IN
+        return out
+
     @staticmethod
     def from_row(row, is_internal: bool = False) -> "TransactionType":
         """Create a TransactionType object from a dataframe row."""
@@ -31,12 +49,24 @@ class TransactionType(Flag):
 
     def is_income(self) -> bool:
         """Determine if the given TransactionType is an income."""
-        return self in (TransactionType.IN, TransactionType.INTERNAL_IN)
+        return self in _INCOME
 
     def is_internal(self) -> bool:
         """Determine if the given TransactionType is an internal transaction."""
-        return self in (TransactionType.INTERNAL_IN, TransactionType.INTERNAL_OUT)
+        return self in internal_types
 
     def __str__(self) -> str:
         """Print the transaction type nicely."""
-        return str.lower(self.name)
+        name = _LOWER_NAMES.get(self)
+        return name if name is not None else (self.name or "").lower()
+
+
+_LUT = {
+    (True, True): TransactionType.INTERNAL_OUT,
+    (True, False): TransactionType.OUT,
+    (False, True): TransactionType.INTERNAL_IN,
+    (False, False): TransactionType.IN,
+}
+_INCOME = frozenset({TransactionType.IN, TransactionType.INTERNAL_IN})
+internal_types = frozenset({TransactionType.INTERNAL_IN, TransactionType.INTERNAL_OUT})
+_LOWER_NAMES = {type_: (type_.name or "").lower() for type_ in TransactionType}